@@ -6,16 +6,53 @@ Author: Your Name
 License: MIT
 """
 
+import os
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import pyperclip  # For clipboard functionality
+from dataclasses import dataclass
+from functools import lru_cache
+from tkinter import ttk, messagebox
 from src.tool import PasswordSecurityTool
 from src.models import StrengthLevel
 
 
+@dataclass(frozen=True)
+class Colors:
+    """Color scheme shared by all GUI widgets."""
+    bg: str = '#f0f4f8'
+    primary: str = '#2563eb'
+    secondary: str = '#64748b'
+    success: str = '#10b981'
+    warning: str = '#f59e0b'
+    danger: str = '#ef4444'
+    white: str = '#ffffff'
+    text: str = '#1e293b'
+
+
+COLORS = Colors()
+
+_TIPS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'data', 'tips.txt')
+
+
+@lru_cache(maxsize=None)
+def _load_tips():
+    """Read the security tips text (once per process)."""
+    with open(_TIPS_FILE, encoding='utf-8') as f:
+        return f.read()
+
+
 class PasswordSecurityGUI:
     """Graphical User Interface for Password Security Tool."""
     
+    # Result color for each strength level
+    _STRENGTH_COLORS = {
+        StrengthLevel.VERY_WEAK: COLORS.danger,
+        StrengthLevel.WEAK: '#f97316',
+        StrengthLevel.FAIR: COLORS.warning,
+        StrengthLevel.GOOD: '#84cc16',
+        StrengthLevel.STRONG: COLORS.success,
+        StrengthLevel.VERY_STRONG: '#059669'
+    }
+    
     def __init__(self, root):
         """Initialize the GUI."""
         self.root = root
@@ -23,27 +60,30 @@ class PasswordSecurityGUI:
         self.root.geometry("900x700")
         self.root.resizable(False, False)
         
-        # Initialize the tool
-        self.tool = PasswordSecurityTool()
+        # The tool is created once the window has been drawn (see _init_tool)
+        self.tool = None
+        
+        # Real-time analysis state (debounce handle, last rendered input)
+        self._pending_check = None
+        self._last_checked_password = None
         
         # Color scheme
-        self.colors = {
-            'bg': '#f0f4f8',
-            'primary': '#2563eb',
-            'secondary': '#64748b',
-            'success': '#10b981',
-            'warning': '#f59e0b',
-            'danger': '#ef4444',
-            'white': '#ffffff',
-            'text': '#1e293b'
-        }
+        self.colors = COLORS
         
         # Configure root
-        self.root.configure(bg=self.colors['bg'])
+        self.root.configure(bg=self.colors.bg)
         
         # Create main container
         self.create_widgets()
         
+        # Defer tool construction off the first paint
+        self.root.after_idle(self._init_tool)
+        
+    def _init_tool(self):
+        """Initialize the tool and replace the loading placeholder."""
+        self.tool = PasswordSecurityTool()
+        self.results_placeholder.config(text="Enter a password above to see the analysis")
+        
     def create_widgets(self):
         """Create all GUI widgets."""
         # Header
@@ -60,7 +100,7 @@ class PasswordSecurityGUI:
         
     def create_header(self):
         """Create header section."""
-        header_frame = tk.Frame(self.root, bg=self.colors['primary'], height=80)
+        header_frame = tk.Frame(self.root, bg=self.colors.primary, height=80)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
         
@@ -68,14 +108,14 @@ class PasswordSecurityGUI:
             header_frame,
             text="🔐 Password Security Tool",
             font=('Arial', 24, 'bold'),
-            bg=self.colors['primary'],
-            fg=self.colors['white']
+            bg=self.colors.primary,
+            fg=self.colors.white
         )
         title_label.pack(pady=20)
         
     def create_checker_tab(self):
         """Create password checker tab."""
-        checker_frame = tk.Frame(self.notebook, bg=self.colors['bg'])
+        checker_frame = tk.Frame(self.notebook, bg=self.colors.bg)
         self.notebook.add(checker_frame, text="  Password Checker  ")
         
         # Title
@@ -83,25 +123,25 @@ class PasswordSecurityGUI:
             checker_frame,
             text="Check Password Strength",
             font=('Arial', 18, 'bold'),
-            bg=self.colors['bg'],
-            fg=self.colors['text']
+            bg=self.colors.bg,
+            fg=self.colors.text
         )
         title.pack(pady=20)
         
         # Input frame
-        input_frame = tk.Frame(checker_frame, bg=self.colors['bg'])
+        input_frame = tk.Frame(checker_frame, bg=self.colors.bg)
         input_frame.pack(pady=10, padx=40, fill='x')
         
         tk.Label(
             input_frame,
             text="Enter Password:",
             font=('Arial', 12),
-            bg=self.colors['bg'],
-            fg=self.colors['text']
+            bg=self.colors.bg,
+            fg=self.colors.text
         ).pack(anchor='w', pady=5)
         
         # Password entry with show/hide
-        entry_container = tk.Frame(input_frame, bg=self.colors['white'])
+        entry_container = tk.Frame(input_frame, bg=self.colors.white)
         entry_container.pack(fill='x')
         
         self.password_entry = tk.Entry(
@@ -122,7 +162,7 @@ class PasswordSecurityGUI:
             font=('Arial', 12),
             command=self.toggle_password_visibility,
             relief='flat',
-            bg=self.colors['white'],
+            bg=self.colors.white,
             cursor='hand2'
         )
         self.show_btn.pack(side='right', padx=5)
@@ -132,8 +172,8 @@ class PasswordSecurityGUI:
             input_frame,
             text="Analyze Password",
             font=('Arial', 12, 'bold'),
-            bg=self.colors['primary'],
-            fg=self.colors['white'],
+            bg=self.colors.primary,
+            fg=self.colors.white,
             command=self.check_password,
             relief='flat',
             cursor='hand2',
@@ -143,22 +183,99 @@ class PasswordSecurityGUI:
         check_btn.pack(pady=10)
         
         # Results frame
-        self.results_frame = tk.Frame(checker_frame, bg=self.colors['white'], relief='ridge', bd=2)
+        self.results_frame = tk.Frame(
+            checker_frame,
+            bg=self.colors.white,
+            relief='ridge',
+            bd=2,
+            height=350
+        )
         self.results_frame.pack(pady=20, padx=40, fill='both', expand=True)
+        # Fixed size: result updates never propagate geometry to the window
+        self.results_frame.pack_propagate(False)
         
         # Placeholder
         self.results_placeholder = tk.Label(
             self.results_frame,
-            text="Enter a password above to see the analysis",
+            text="Loading…",
             font=('Arial', 12),
-            bg=self.colors['white'],
-            fg=self.colors['secondary']
+            bg=self.colors.white,
+            fg=self.colors.secondary
         )
         self.results_placeholder.pack(pady=50)
         
+        self.create_result_widgets()
+        
+    def create_result_widgets(self):
+        """Create the analysis result widgets once; they are updated in place."""
+        # Strength label
+        self.strength_label = tk.Label(
+            self.results_frame,
+            font=('Arial', 16, 'bold'),
+            bg=self.colors.white
+        )
+        
+        # Progress bar
+        self.progress_frame = tk.Frame(self.results_frame, bg=self.colors.white)
+        
+        # One ttk style per strength level, so an update is a style switch
+        style = ttk.Style(self.root)
+        for level, color in self._STRENGTH_COLORS.items():
+            style.configure(
+                f'{level.name}.Horizontal.TProgressbar',
+                background=color,
+                troughcolor=self.colors.bg,
+                thickness=30
+            )
+        
+        self.strength_bar = ttk.Progressbar(
+            self.progress_frame,
+            orient='horizontal',
+            mode='determinate',
+            maximum=10
+        )
+        # Width comes from the layout (fill='x'), never from a pre-layout query
+        self.strength_bar.pack(fill='x')
+        
+        # Stats
+        self.stats_frame = tk.Frame(self.results_frame, bg=self.colors.white)
+        
+        self.score_label = tk.Label(
+            self.stats_frame,
+            font=('Arial', 12),
+            bg=self.colors.white
+        )
+        self.score_label.grid(row=0, column=0, padx=20, pady=5)
+        
+        self.entropy_label = tk.Label(
+            self.stats_frame,
+            font=('Arial', 12),
+            bg=self.colors.white
+        )
+        self.entropy_label.grid(row=0, column=1, padx=20, pady=5)
+        
+        self.crack_label = tk.Label(
+            self.stats_frame,
+            font=('Arial', 12),
+            bg=self.colors.white
+        )
+        self.crack_label.grid(row=1, column=0, columnspan=2, pady=5)
+        
+        # Feedback (labels are pooled and hidden rather than destroyed)
+        self.feedback_frame = tk.LabelFrame(
+            self.results_frame,
+            text="Suggestions for Improvement",
+            font=('Arial', 11, 'bold'),
+            bg=self.colors.white,
+            fg=self.colors.text
+        )
+        self._feedback_label_pool = []
+        self._feedback_visible = 0
+        self._results_shown = False
+        
     def create_generator_tab(self):
         """Create password generator tab."""
-        generator_frame = tk.Frame(self.notebook, bg=self.colors['bg'])
+        generator_frame = tk.Frame(self.notebook, bg=self.colors.bg)
         self.notebook.add(generator_frame, text="  Password Generator  ")
         
         # Title
@@ -166,8 +283,8 @@ class PasswordSecurityGUI:
             generator_frame,
             text="Generate Secure Password",
             font=('Arial', 18, 'bold'),
-            bg=self.colors['bg'],
-            fg=self.colors['text']
+            bg=self.colors.bg,
+            fg=self.colors.text
         )
         title.pack(pady=20)
         
@@ -176,22 +293,22 @@ class PasswordSecurityGUI:
             generator_frame,
             text="Password Settings",
             font=('Arial', 12, 'bold'),
-            bg=self.colors['white'],
-            fg=self.colors['text'],
+            bg=self.colors.white,
+            fg=self.colors.text,
             padx=20,
             pady=20
         )
         settings_frame.pack(pady=10, padx=40, fill='x')
         
         # Length slider
-        length_frame = tk.Frame(settings_frame, bg=self.colors['white'])
+        length_frame = tk.Frame(settings_frame, bg=self.colors.white)
         length_frame.pack(fill='x', pady=10)
         
         tk.Label(
             length_frame,
             text="Password Length:",
             font=('Arial', 11),
-            bg=self.colors['white']
+            bg=self.colors.white
         ).pack(side='left')
         
         self.length_var = tk.IntVar(value=16)
@@ -199,8 +316,8 @@ class PasswordSecurityGUI:
             length_frame,
             text="16",
             font=('Arial', 11, 'bold'),
-            bg=self.colors['white'],
-            fg=self.colors['primary']
+            bg=self.colors.white,
+            fg=self.colors.primary
         )
         self.length_label.pack(side='right')
         
@@ -211,9 +328,9 @@ class PasswordSecurityGUI:
             orient='horizontal',
             variable=self.length_var,
             command=self.update_length_label,
-            bg=self.colors['white'],
+            bg=self.colors.white,
             highlightthickness=0,
-            troughcolor=self.colors['bg']
+            troughcolor=self.colors.bg
         )
         self.length_slider.pack(fill='x', pady=5)
         
@@ -223,7 +340,7 @@ class PasswordSecurityGUI:
         self.use_digits = tk.BooleanVar(value=True)
         self.use_symbols = tk.BooleanVar(value=True)
         
-        checkbox_frame = tk.Frame(settings_frame, bg=self.colors['white'])
+        checkbox_frame = tk.Frame(settings_frame, bg=self.colors.white)
         checkbox_frame.pack(pady=10)
         
         tk.Checkbutton(
@@ -231,7 +348,7 @@ class PasswordSecurityGUI:
             text="Lowercase (a-z)",
             variable=self.use_lowercase,
             font=('Arial', 10),
-            bg=self.colors['white']
+            bg=self.colors.white
         ).grid(row=0, column=0, sticky='w', padx=10, pady=5)
         
         tk.Checkbutton(
@@ -239,7 +356,7 @@ class PasswordSecurityGUI:
             text="Uppercase (A-Z)",
             variable=self.use_uppercase,
             font=('Arial', 10),
-            bg=self.colors['white']
+            bg=self.colors.white
         ).grid(row=0, column=1, sticky='w', padx=10, pady=5)
         
         tk.Checkbutton(
@@ -247,7 +364,7 @@ class PasswordSecurityGUI:
             text="Numbers (0-9)",
             variable=self.use_digits,
             font=('Arial', 10),
-            bg=self.colors['white']
+            bg=self.colors.white
         ).grid(row=1, column=0, sticky='w', padx=10, pady=5)
         
         tk.Checkbutton(
@@ -255,7 +372,7 @@ class PasswordSecurityGUI:
             text="Symbols (!@#$)",
             variable=self.use_symbols,
             font=('Arial', 10),
-            bg=self.colors['white']
+            bg=self.colors.white
         ).grid(row=1, column=1, sticky='w', padx=10, pady=5)
         
         # Generate button
@@ -263,8 +380,8 @@ class PasswordSecurityGUI:
             generator_frame,
             text="🔑 Generate Password",
             font=('Arial', 12, 'bold'),
-            bg=self.colors['success'],
-            fg=self.colors['white'],
+            bg=self.colors.success,
+            fg=self.colors.white,
             command=self.generate_password,
             relief='flat',
             cursor='hand2',
@@ -278,8 +395,8 @@ class PasswordSecurityGUI:
             generator_frame,
             text="Generated Password",
             font=('Arial', 12, 'bold'),
-            bg=self.colors['white'],
-            fg=self.colors['text'],
+            bg=self.colors.white,
+            fg=self.colors.text,
             padx=20,
             pady=20
         )
@@ -293,7 +410,7 @@ class PasswordSecurityGUI:
             justify='center',
             state='readonly',
             relief='flat',
-            bg=self.colors['bg']
+            bg=self.colors.bg
         )
         password_display.pack(fill='x', pady=10)
         
@@ -302,8 +419,8 @@ class PasswordSecurityGUI:
             display_frame,
             text="📋 Copy to Clipboard",
             font=('Arial', 11),
-            bg=self.colors['primary'],
-            fg=self.colors['white'],
+            bg=self.colors.primary,
+            fg=self.colors.white,
             command=self.copy_password,
             relief='flat',
             cursor='hand2',
@@ -317,8 +434,8 @@ class PasswordSecurityGUI:
             generator_frame,
             text="Or Generate Passphrase",
             font=('Arial', 12, 'bold'),
-            bg=self.colors['white'],
-            fg=self.colors['text'],
+            bg=self.colors.white,
+            fg=self.colors.text,
             padx=20,
             pady=20
         )
@@ -328,8 +445,8 @@ class PasswordSecurityGUI:
             passphrase_frame,
             text="Generate Passphrase",
             font=('Arial', 11),
-            bg=self.colors['secondary'],
-            fg=self.colors['white'],
+            bg=self.colors.secondary,
+            fg=self.colors.white,
             command=self.generate_passphrase,
             relief='flat',
             cursor='hand2',
@@ -340,112 +457,47 @@ class PasswordSecurityGUI:
         
     def create_tips_tab(self):
         """Create security tips tab."""
-        tips_frame = tk.Frame(self.notebook, bg=self.colors['bg'])
-        self.notebook.add(tips_frame, text="  Security Tips  ")
+        from tkinter import scrolledtext
+        
+        self.tips_frame = tk.Frame(self.notebook, bg=self.colors.bg)
+        self.notebook.add(self.tips_frame, text="  Security Tips  ")
         
         # Title
         title = tk.Label(
-            tips_frame,
+            self.tips_frame,
             text="Password Security Best Practices",
             font=('Arial', 18, 'bold'),
-            bg=self.colors['bg'],
-            fg=self.colors['text']
+            bg=self.colors.bg,
+            fg=self.colors.text
         )
         title.pack(pady=20)
         
         # Tips text
-        tips_text = scrolledtext.ScrolledText(
-            tips_frame,
+        self.tips_text = scrolledtext.ScrolledText(
+            self.tips_frame,
             font=('Arial', 11),
             wrap='word',
-            bg=self.colors['white'],
+            bg=self.colors.white,
             relief='flat',
             padx=20,
             pady=20
         )
-        tips_text.pack(pady=10, padx=40, fill='both', expand=True)
+        self.tips_text.pack(pady=10, padx=40, fill='both', expand=True)
+        self.tips_text.config(state='disabled')
         
-        tips_content = """
-🔐 PASSWORD SECURITY TIPS
-
-1. LENGTH MATTERS
-   • Use at least 12 characters (16+ recommended)
-   • Longer passwords are exponentially harder to crack
-   • Each additional character dramatically increases security
-
-2. USE VARIETY
-   • Mix uppercase letters (A-Z)
-   • Mix lowercase letters (a-z)
-   • Include numbers (0-9)
-   • Add special characters (!@#$%^&*)
-
-3. AVOID PATTERNS
-   • Don't use dictionary words
-   • Avoid personal information (birthdays, names)
-   • No keyboard patterns (qwerty, 123456)
-   • Avoid repeated characters (aaa, 111)
-
-4. UNIQUE PASSWORDS
-   • Never reuse passwords across accounts
-   • One breach shouldn't compromise all accounts
-   • Use different passwords for work and personal
-
-5. USE A PASSWORD MANAGER
-   • Store passwords securely and encrypted
-   • Generate strong unique passwords easily
-   • Access passwords across all devices
-   • Popular options: Bitwarden, 1Password, LastPass
-
-6. ENABLE TWO-FACTOR AUTHENTICATION (2FA)
-   • Adds a second layer of security
-   • Protects even if password is compromised
-   • Use authenticator apps over SMS when possible
-
-7. REGULAR UPDATES
-   • Change passwords for sensitive accounts periodically
-   • Update immediately if you suspect a breach
-   • Change default passwords on all devices
-
-8. PASSPHRASES
-   • Consider memorable passphrases (4+ random words)
-   • Example: "correct-horse-battery-staple"
-   • Easier to remember, harder to crack
-   • Can be more secure than complex passwords
-
-9. AVOID PERSONAL INFO
-   • Don't use birthdays, anniversaries, or names
-   • Attackers can easily find this information online
-   • Avoid pet names, favorite teams, or hobbies
-
-10. BE WARY OF PHISHING
-    • Never enter passwords on suspicious websites
-    • Check URL carefully before entering credentials
-    • Watch for spelling mistakes in domains
-    • Don't click links in unexpected emails
-
-COMMON PASSWORD MYTHS:
-
-❌ MYTH: Changing passwords frequently makes you safer
-✅ FACT: Focus on strong, unique passwords over frequent changes
-
-❌ MYTH: Complex but short passwords are secure
-✅ FACT: Length is more important than complexity
-
-❌ MYTH: Password managers are risky
-✅ FACT: They're much safer than reusing passwords
-
-REMEMBER:
-The best password is one that's:
-• Long (16+ characters)
-• Random (no patterns)
-• Unique (used nowhere else)
-• Stored securely (in a password manager)
-
-Stay safe online! 🛡️
-        """
+        # Tips are loaded when the tab is first shown
+        self._tips_loaded = False
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
         
-        tips_text.insert('1.0', tips_content)
-        tips_text.config(state='disabled')
+    def on_tab_changed(self, event=None):
+        """Populate the tips tab the first time it is selected."""
+        if self._tips_loaded or self.notebook.select() != str(self.tips_frame):
+            return
+        
+        self.tips_text.config(state='normal')
+        self.tips_text.insert('1.0', _load_tips())
+        self.tips_text.config(state='disabled')
+        self._tips_loaded = True
         
     def toggle_password_visibility(self):
         """Toggle password visibility."""
@@ -460,110 +512,115 @@ Stay safe online! 🛡️
             
     def on_password_change(self, event=None):
         """Handle password entry change for real-time feedback."""
+        # Debounce: only the last keystroke of a burst triggers analysis
+        if self._pending_check:
+            self.root.after_cancel(self._pending_check)
+            self._pending_check = None
+        
         password = self.password_entry.get()
         if password:
-            self.check_password()
+            self._pending_check = self.root.after(150, self.check_password, password)
+        else:
+            # Entry cleared: drop memoized analyses of earlier input
+            self._last_checked_password = None
+            if self.tool is not None:
+                self.tool.checker.clear_cache()
             
-    def check_password(self):
-        """Check password strength and display results."""
-        password = self.password_entry.get()
+    def check_password(self, password=None):
+        """Check password strength and display results (defaults to the entry text)."""
+        if self._pending_check:
+            self.root.after_cancel(self._pending_check)
+            self._pending_check = None
+        
+        # The tool is still being created (see _init_tool)
+        if self.tool is None:
+            return
+        
+        if password is None:
+            password = self.password_entry.get()
         
         if not password:
             messagebox.showwarning("Empty Password", "Please enter a password to check.")
             return
         
-        # Clear previous results
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
+        # Results for this input are already on screen
+        if password == self._last_checked_password:
+            return
+        
+        self._show_analysis(password)
+        self._last_checked_password = password
         
+    def _show_analysis(self, password):
+        """Analyze a password and update the result widgets."""
         # Analyze password
         analysis = self.tool.checker.check_strength(password)
         
+        # Swap the placeholder for the result widgets on first use
+        if not self._results_shown:
+            self.results_placeholder.pack_forget()
+            self.strength_label.pack(pady=10)
+            self.progress_frame.pack(fill='x', padx=20, pady=10)
+            self.stats_frame.pack(pady=10)
+            self._results_shown = True
+        
         # Strength label with color
-        strength_colors = {
-            StrengthLevel.VERY_WEAK: self.colors['danger'],
-            StrengthLevel.WEAK: '#f97316',
-            StrengthLevel.FAIR: self.colors['warning'],
-            StrengthLevel.GOOD: '#84cc16',
-            StrengthLevel.STRONG: self.colors['success'],
-            StrengthLevel.VERY_STRONG: '#059669'
-        }
+        strength_color = self._STRENGTH_COLORS.get(analysis.strength, self.colors.secondary)
         
-        strength_color = strength_colors.get(analysis.strength, self.colors['secondary'])
-        
-        tk.Label(
-            self.results_frame,
-            text=f"Strength: {analysis.strength.name}",
-            font=('Arial', 16, 'bold'),
-            bg=self.colors['white'],
-            fg=strength_color
-        ).pack(pady=10)
+        self.strength_label.config(text=f"Strength: {analysis.strength.name}", fg=strength_color)
         
         # Progress bar
-        progress_frame = tk.Frame(self.results_frame, bg=self.colors['white'])
-        progress_frame.pack(fill='x', padx=20, pady=10)
-        
-        canvas = tk.Canvas(progress_frame, height=30, bg=self.colors['bg'], highlightthickness=0)
-        canvas.pack(fill='x')
-        
-        bar_width = (analysis.score / 10) * canvas.winfo_reqwidth()
-        if bar_width < 50:
-            bar_width = 50
-        canvas.create_rectangle(0, 0, bar_width, 30, fill=strength_color, outline='')
+        self.strength_bar['value'] = analysis.score
+        self.strength_bar.configure(style=f'{analysis.strength.name}.Horizontal.TProgressbar')
         
         # Stats
-        stats_frame = tk.Frame(self.results_frame, bg=self.colors['white'])
-        stats_frame.pack(pady=10)
-        
-        tk.Label(
-            stats_frame,
-            text=f"Score: {analysis.score}/10",
-            font=('Arial', 12),
-            bg=self.colors['white']
-        ).grid(row=0, column=0, padx=20, pady=5)
-        
-        tk.Label(
-            stats_frame,
-            text=f"Entropy: {analysis.entropy} bits",
-            font=('Arial', 12),
-            bg=self.colors['white']
-        ).grid(row=0, column=1, padx=20, pady=5)
-        
-        tk.Label(
-            stats_frame,
-            text=f"Time to Crack: {analysis.time_to_crack}",
-            font=('Arial', 12),
-            bg=self.colors['white']
-        ).grid(row=1, column=0, columnspan=2, pady=5)
+        self.score_label.config(text=f"Score: {analysis.score}/10")
+        self.entropy_label.config(text=f"Entropy: {analysis.entropy} bits")
+        self.crack_label.config(text=f"Time to Crack: {analysis.time_to_crack}")
         
         # Feedback
         if analysis.feedback:
-            feedback_frame = tk.LabelFrame(
-                self.results_frame,
-                text="Suggestions for Improvement",
-                font=('Arial', 11, 'bold'),
-                bg=self.colors['white'],
-                fg=self.colors['text']
-            )
-            feedback_frame.pack(pady=10, padx=20, fill='x')
-            
-            for item in analysis.feedback:
-                tk.Label(
-                    feedback_frame,
-                    text=f"• {item}",
-                    font=('Arial', 10),
-                    bg=self.colors['white'],
-                    fg=self.colors['text'],
-                    anchor='w',
-                    justify='left'
-                ).pack(anchor='w', padx=10, pady=2)
-                
+            self.feedback_frame.pack(pady=10, padx=20, fill='x')
+        else:
+            self.feedback_frame.pack_forget()
+        self._update_feedback_labels(analysis.feedback)
+        
+        # Lay out and paint all of the above in one pass
+        self.results_frame.update_idletasks()
+        
+    def _update_feedback_labels(self, feedback):
+        """Show one pooled label per feedback item, hiding the rest."""
+        pool = self._feedback_label_pool
+        
+        while len(pool) < len(feedback):
+            pool.append(tk.Label(
+                self.feedback_frame,
+                font=('Arial', 10),
+                bg=self.colors.white,
+                fg=self.colors.text,
+                anchor='w',
+                justify='left'
+            ))
+        
+        for label, item in zip(pool, feedback):
+            label.config(text=f"• {item}")
+        
+        # Visible labels are always a prefix of the pool, so packing order holds
+        for label in pool[self._feedback_visible:len(feedback)]:
+            label.pack(anchor='w', padx=10, pady=2)
+        for label in pool[len(feedback):self._feedback_visible]:
+            label.pack_forget()
+        self._feedback_visible = len(feedback)
+        
     def update_length_label(self, value):
         """Update length label when slider moves."""
         self.length_label.config(text=str(int(float(value))))
         
     def generate_password(self):
         """Generate a random password."""
+        # The tool is still being created (see _init_tool)
+        if self.tool is None:
+            return
+        
         try:
             password = self.tool.generator.generate(
                 length=self.length_var.get(),
@@ -579,6 +636,10 @@ Stay safe online! 🛡️
             
     def generate_passphrase(self):
         """Generate a passphrase."""
+        # The tool is still being created (see _init_tool)
+        if self.tool is None:
+            return
+        
         passphrase = self.tool.generator.generate_passphrase(word_count=4)
         self.generated_password_var.set(passphrase)
         messagebox.showinfo("Success", "Passphrase generated successfully!")
@@ -588,6 +649,7 @@ Stay safe online! 🛡️
         password = self.generated_password_var.get()
         if password and password != "Click 'Generate Password' to create one":
             try:
+                import pyperclip  # For clipboard functionality
                 pyperclip.copy(password)
                 messagebox.showinfo("Copied", "Password copied to clipboard!")
             except:
@@ -13,7 +13,8 @@ from src.tool import PasswordSecurityTool
 def main():
     """Main entry point for the application."""
     try:
-        tool = PasswordSecurityTool()
+        # One-off CLI inputs gain nothing from caching; keep them out of memory
+        tool = PasswordSecurityTool(cache_analyses=False)
         tool.display_menu()
     except KeyboardInterrupt:
         print("\n\nProgram interrupted by user. Exiting...")
@@ -5,12 +5,117 @@
 Password strength checker implementation.
 """
 
+import os
 import re
 import math
+import bisect
+import string
+from functools import lru_cache
 from typing import List, Tuple
 from .models import PasswordAnalysis, StrengthLevel
 
 
+# Character class bits
+_LOWER = 1
+_UPPER = 2
+_DIGIT = 4
+_SYMBOL = 8
+
+
+def _build_char_class_table() -> bytes:
+    """Build a 256-entry lookup table mapping each byte to its class bit."""
+    table = bytearray([_SYMBOL]) * 256
+    for c in string.ascii_lowercase:
+        table[ord(c)] = _LOWER
+    for c in string.ascii_uppercase:
+        table[ord(c)] = _UPPER
+    for c in string.digits:
+        table[ord(c)] = _DIGIT
+    return bytes(table)
+
+
+_CHAR_CLASS = _build_char_class_table()
+
+# Charset size and its log2 for every combination of class bits
+_CLASS_SIZES = (
+    (_LOWER, 26),
+    (_UPPER, 26),
+    (_DIGIT, 10),
+    (_SYMBOL, 32),  # Approximate number of common symbols
+)
+_CHARSET_SIZE = [
+    sum(size for bit, size in _CLASS_SIZES if flags & bit)
+    for flags in range(16)
+]
+_LOG2_CHARSET_SIZE = [math.log2(size) if size else 0.0 for size in _CHARSET_SIZE]
+
+# Packaged list of common (breached) passwords, loaded on first use
+_COMMON_PASSWORDS_FILE = os.path.join(os.path.dirname(__file__), 'data', 'common_passwords.txt')
+
+
+@lru_cache(maxsize=None)
+def _load_common_passwords() -> frozenset:
+    """
+    Load the packaged common-password list as a lowercase frozenset, merged
+    with PasswordStrengthChecker.COMMON_PASSWORDS so one lookup checks both.
+    """
+    with open(_COMMON_PASSWORDS_FILE, encoding='utf-8') as f:
+        loaded = frozenset(
+            line.strip().lower()
+            for line in f
+            if line.strip() and not line.startswith('#')
+        )
+    return loaded | PasswordStrengthChecker.COMMON_PASSWORDS
+
+
+# Three or more identical characters in a row
+_REPEAT_RE = re.compile(r'(.)\1{2,}')
+
+
+def _scan(password: str) -> Tuple[int, bool]:
+    """
+    Classify a password without any Python-level per-character loop.
+    
+    Returns:
+        (flags, has_repeat): the OR of the class bits of every character,
+        and whether it contains three identical characters in a row.
+        Characters outside Latin-1 are replaced with '?' and count as symbols.
+    """
+    # translate() maps every byte to its class bit in C; at most four
+    # distinct values remain to be OR-ed together
+    flags = 0
+    for bit in set(password.encode('latin-1', 'replace').translate(_CHAR_CLASS)):
+        flags |= bit
+    return flags, _REPEAT_RE.search(password) is not None
+
+
+# Strength tiers: a score above the i-th break (or entropy at or above it)
+# qualifies for level i + 1
+_STRENGTH_LEVELS = (
+    StrengthLevel.VERY_WEAK,
+    StrengthLevel.WEAK,
+    StrengthLevel.FAIR,
+    StrengthLevel.GOOD,
+    StrengthLevel.STRONG,
+    StrengthLevel.VERY_STRONG,
+)
+_SCORE_BREAKS = (0, 2, 4, 6, 8)
+_ENTROPY_BREAKS = (28, 36, 50, 60, 70)
+
+# Brute-force crack time model: guess rate and display units (in seconds)
+_LOG2_GUESSES_PER_SECOND = math.log2(1e9)
+_CRACK_TIME_UNITS = [
+    (1, "seconds"),
+    (60, "minutes"),
+    (3600, "hours"),
+    (86400, "days"),
+    (31536000, "years"),
+]
+# Lower bound of each unit's bucket in log2(seconds), plus the "Centuries" cutoff
+_CRACK_TIME_BREAKS = [math.log2(seconds) for seconds, _ in _CRACK_TIME_UNITS]
+_CRACK_TIME_BREAKS.append(math.log2(31536000 * 100))
+
+
 class PasswordStrengthChecker:
     """
     A comprehensive password strength checker that analyzes passwords
@@ -18,13 +123,13 @@ class PasswordStrengthChecker:
     """
     
     # Common weak passwords and patterns
-    COMMON_PASSWORDS = [
+    COMMON_PASSWORDS = frozenset({
         'password', '123456', '12345678', 'qwerty', 'abc123',
         'monkey', '1234567', 'letmein', 'trustno1', 'dragon',
         'baseball', 'iloveyou', 'master', 'sunshine', 'ashley',
         'bailey', 'passw0rd', 'shadow', '123123', '654321',
         'admin', 'welcome', 'login', 'password1', 'qwerty123'
-    ]
+    })
     
     COMMON_PATTERNS = ['123', 'abc', 'qwe', '111', '000', 'aaa']
     
@@ -33,22 +138,67 @@ class PasswordStrengthChecker:
         'qwertyuiop', 'asdfghjkl', 'zxcvbnm'
     ]
     
-    def __init__(self):
-        """Initialize the password strength checker."""
+    # Each pattern list compiled into a single alternation (one scan per check)
+    _COMMON_PATTERN_RE = re.compile('|'.join(map(re.escape, COMMON_PATTERNS)))
+    _KEYBOARD_PATTERN_RE = re.compile('|'.join(map(re.escape, KEYBOARD_PATTERNS)))
+    
+    def __init__(self, cache_analyses: bool = True):
+        """
+        Initialize the password strength checker.
+        
+        Args:
+            cache_analyses: Memoize results of recent analyses. Cached
+                passwords stay in memory until clear_cache() is called.
+        """
         self.min_length = 8
         self.recommended_length = 12
         self.strong_length = 16
+        
+        self._cached_analyze = lru_cache(maxsize=512)(self._analyze) if cache_analyses else None
     
     def check_strength(self, password: str) -> PasswordAnalysis:
         """
         Analyze password strength and return comprehensive results.
         
+        When caching is enabled, repeated calls with the same password
+        return the same PasswordAnalysis object, which should be treated
+        as read-only.
+        
         Args:
             password: The password to analyze
             
         Returns:
             PasswordAnalysis object containing detailed analysis
         """
+        if self._cached_analyze is not None:
+            return self._cached_analyze(password)
+        return self._analyze(password)
+    
+    def clear_cache(self) -> None:
+        """Discard all memoized analyses (and the passwords they hold)."""
+        if self._cached_analyze is not None:
+            self._cached_analyze.cache_clear()
+    
+    def check_strength_batch(self, passwords: List[str]) -> List[PasswordAnalysis]:
+        """
+        Analyze many passwords at once (e.g. auditing a wordlist).
+        
+        Each password is analyzed individually, one at a time, so memory use
+        does not depend on the longest entry. Results are identical to
+        check_strength() and are never added to the analysis cache, so a
+        large wordlist does not evict interactive results.
+        
+        Args:
+            passwords: The passwords to analyze
+            
+        Returns:
+            List of PasswordAnalysis objects, in input order
+        """
+        analyze = self._analyze
+        return [analyze(password) for password in passwords]
+    
+    def _analyze(self, password: str) -> PasswordAnalysis:
+        """Run the full analysis pipeline on a password."""
         if not password:
             return PasswordAnalysis(
                 password="",
@@ -59,31 +209,38 @@ class PasswordStrengthChecker:
                 time_to_crack="Instant"
             )
         
+        flags, has_repeat = _scan(password)
+        return self._build_analysis(password, flags, has_repeat)
+    
+    def _build_analysis(self, password: str, flags: int, has_repeat: bool) -> PasswordAnalysis:
+        """Score a non-empty password given its character-class flags and repeat flag."""
         score = 0
         feedback = []
+        length = len(password)
+        lower_pwd = password.lower()
         
         # Length analysis
-        length_score, length_feedback = self._check_length(password)
+        length_score, length_feedback = self._check_length(length)
         score += length_score
         feedback.extend(length_feedback)
         
         # Character variety analysis
-        variety_score, variety_feedback = self._check_character_variety(password)
+        variety_score, variety_feedback = self._check_character_variety(flags)
         score += variety_score
         feedback.extend(variety_feedback)
         
         # Pattern and common password detection
-        pattern_penalty, pattern_feedback = self._check_patterns(password)
+        pattern_penalty, pattern_feedback = self._check_patterns(lower_pwd)
         score += pattern_penalty
         feedback.extend(pattern_feedback)
         
         # Sequential and repeated character detection
-        sequence_penalty, sequence_feedback = self._check_sequences(password)
+        sequence_penalty, sequence_feedback = self._check_sequences(lower_pwd, has_repeat)
         score += sequence_penalty
         feedback.extend(sequence_feedback)
         
         # Calculate entropy
-        entropy = self._calculate_entropy(password)
+        entropy = self._calculate_entropy(length, flags)
         
         # Determine strength level
         strength = self._determine_strength(score, entropy)
@@ -100,9 +257,8 @@ class PasswordStrengthChecker:
             time_to_crack=time_to_crack
         )
     
-    def _check_length(self, password: str) -> Tuple[int, List[str]]:
+    def _check_length(self, length: int) -> Tuple[int, List[str]]:
         """Check password length and assign score."""
-        length = len(password)
         feedback = []
         score = 0
         
@@ -119,15 +275,15 @@ class PasswordStrengthChecker:
         
         return score, feedback
     
-    def _check_character_variety(self, password: str) -> Tuple[int, List[str]]:
+    def _check_character_variety(self, flags: int) -> Tuple[int, List[str]]:
         """Check for character variety (uppercase, lowercase, digits, symbols)."""
         feedback = []
         score = 0
         
-        has_lower = bool(re.search(r'[a-z]', password))
-        has_upper = bool(re.search(r'[A-Z]', password))
-        has_digit = bool(re.search(r'\d', password))
-        has_symbol = bool(re.search(r'[^a-zA-Z0-9]', password))
+        has_lower = bool(flags & _LOWER)
+        has_upper = bool(flags & _UPPER)
+        has_digit = bool(flags & _DIGIT)
+        has_symbol = bool(flags & _SYMBOL)
         
         if has_lower:
             score += 1
@@ -151,104 +307,69 @@ class PasswordStrengthChecker:
         
         return score, feedback
     
-    def _check_patterns(self, password: str) -> Tuple[int, List[str]]:
-        """Check for common passwords and patterns."""
+    def _check_patterns(self, lower_pwd: str) -> Tuple[int, List[str]]:
+        """Check the lowercased password for common passwords and patterns."""
         feedback = []
         penalty = 0
         
-        lower_pwd = password.lower()
-        
         # Check against common passwords
-        if lower_pwd in self.COMMON_PASSWORDS:
+        if lower_pwd in _load_common_passwords():
             feedback.append("This is a commonly used password - avoid it")
             penalty -= 5
         
         # Check for common patterns
-        for pattern in self.COMMON_PATTERNS:
-            if pattern in lower_pwd:
-                feedback.append(f"Avoid common patterns like '{pattern}'")
-                penalty -= 1
-                break
+        match = self._COMMON_PATTERN_RE.search(lower_pwd)
+        if match:
+            feedback.append(f"Avoid common patterns like '{match.group()}'")
+            penalty -= 1
         
         return penalty, feedback
     
-    def _check_sequences(self, password: str) -> Tuple[int, List[str]]:
+    def _check_sequences(self, lower_pwd: str, has_repeat: bool) -> Tuple[int, List[str]]:
         """Check for repeated and sequential characters."""
         feedback = []
         penalty = 0
         
         # Check for repeated characters (3+ same characters in a row)
-        if re.search(r'(.)\1{2,}', password):
+        if has_repeat:
             feedback.append("Avoid repeated characters (e.g., 'aaa', '111')")
             penalty -= 1
         
         # Check for keyboard sequences
-        lower_pwd = password.lower()
-        for pattern in self.KEYBOARD_PATTERNS:
-            if pattern in lower_pwd:
-                feedback.append("Avoid keyboard patterns")
-                penalty -= 1
-                break
+        if self._KEYBOARD_PATTERN_RE.search(lower_pwd):
+            feedback.append("Avoid keyboard patterns")
+            penalty -= 1
         
         return penalty, feedback
     
-    def _calculate_entropy(self, password: str) -> float:
+    def _calculate_entropy(self, length: int, flags: int) -> float:
         """
         Calculate password entropy in bits.
         Entropy = log2(charset_size^length)
         """
-        charset_size = 0
-        
-        if re.search(r'[a-z]', password):
-            charset_size += 26
-        if re.search(r'[A-Z]', password):
-            charset_size += 26
-        if re.search(r'\d', password):
-            charset_size += 10
-        if re.search(r'[^a-zA-Z0-9]', password):
-            charset_size += 32  # Approximate number of common symbols
-        
-        if charset_size == 0:
-            return 0.0
-        
-        entropy = len(password) * math.log2(charset_size)
+        entropy = length * _LOG2_CHARSET_SIZE[flags]
         return round(entropy, 2)
     
     def _determine_strength(self, score: int, entropy: float) -> StrengthLevel:
         """Determine overall password strength based on score and entropy."""
-        if score <= 0 or entropy < 28:
-            return StrengthLevel.VERY_WEAK
-        elif score <= 2 or entropy < 36:
-            return StrengthLevel.WEAK
-        elif score <= 4 or entropy < 50:
-            return StrengthLevel.FAIR
-        elif score <= 6 or entropy < 60:
-            return StrengthLevel.GOOD
-        elif score <= 8 or entropy < 70:
-            return StrengthLevel.STRONG
-        else:
-            return StrengthLevel.VERY_STRONG
+        # A level is reached only when both the score and the entropy reach it
+        score_tier = bisect.bisect_left(_SCORE_BREAKS, score)
+        entropy_tier = bisect.bisect_right(_ENTROPY_BREAKS, entropy)
+        return _STRENGTH_LEVELS[min(score_tier, entropy_tier)]
     
     def _estimate_crack_time(self, entropy: float) -> str:
         """
         Estimate time to crack password using brute force.
         Assumes 1 billion guesses per second.
         """
-        attempts = 2 ** entropy
-        guesses_per_second = 1e9
-        seconds = attempts / guesses_per_second
+        # Work in log2(seconds) so huge entropies never overflow a float
+        log2_seconds = entropy - _LOG2_GUESSES_PER_SECOND
+        bucket = bisect.bisect_right(_CRACK_TIME_BREAKS, log2_seconds)
         
-        if seconds < 1:
+        if bucket == 0:
             return "Instant"
-        elif seconds < 60:
-            return f"{int(seconds)} seconds"
-        elif seconds < 3600:
-            return f"{int(seconds / 60)} minutes"
-        elif seconds < 86400:
-            return f"{int(seconds / 3600)} hours"
-        elif seconds < 31536000:
-            return f"{int(seconds / 86400)} days"
-        elif seconds < 31536000 * 100:
-            return f"{int(seconds / 31536000)} years"
-        else:
+        elif bucket > len(_CRACK_TIME_UNITS):
             return "Centuries"
+        
+        unit_seconds, unit_name = _CRACK_TIME_UNITS[bucket - 1]
+        return f"{int(2 ** (log2_seconds - math.log2(unit_seconds)))} {unit_name}"
@@ -5,9 +5,83 @@
 Secure password generator implementation.
 """
 
-import secrets
+import os
+import random
 import string
-from typing import List
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+
+# Bulk draws at least this large check character types with NumPy (if installed);
+# below it the import and array setup cost more than they save
+_VECTORIZE_MIN_COUNT = 1024
+
+# Character types as ASCII bytes, ready for bytes.translate() tables
+_LOWER = string.ascii_lowercase.encode('ascii')
+_UPPER = string.ascii_uppercase.encode('ascii')
+_DIGITS = string.digits.encode('ascii')
+_SYMBOLS_STR = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+_SYMBOLS = _SYMBOLS_STR.encode('ascii')
+_TYPES = (_LOWER, _UPPER, _DIGITS, _SYMBOLS)
+_DIGITS_TABLE = _DIGITS.ljust(256, b'\0')
+
+# PINs up to this many digits are drawn from a single 64-bit random value
+_PIN_WORD_LIMIT = 2 ** 64
+_PIN_WORD_DIGITS = len(str(_PIN_WORD_LIMIT)) - 1
+
+
+@lru_cache(maxsize=None)
+def _byte_reduction(modulus: int) -> Tuple[bytes, bytes]:
+    """
+    Build bytes.translate() arguments that turn random bytes into unbiased
+    values in range(modulus): a table reducing each byte modulo modulus,
+    and the bytes at or above the largest multiple of modulus to delete.
+    """
+    cutoff = 256 - 256 % modulus
+    table = bytes(value % modulus for value in range(256))
+    return table, bytes(range(cutoff, 256))
+
+
+def _draw_reduced(
+    random_bytes: Callable[[int], bytes],
+    n: int,
+    reduction: bytes,
+    rejected: bytes
+) -> bytes:
+    """
+    Draw n unbiased values using the _byte_reduction() tables for a modulus.
+    
+    At least half of all byte values are accepted, so 2x oversampling almost
+    always fills the request in a single random_bytes() call.
+    """
+    indices = b''
+    while len(indices) < n:
+        indices += random_bytes(2 * (n - len(indices))).translate(reduction, rejected)
+    return indices[:n]
+
+
+def _contains_all(password: str, types: Tuple[str, ...]) -> bool:
+    """Check that password contains at least one character of every type."""
+    drawn = set(password)
+    return all(not drawn.isdisjoint(chars) for chars in types)
+
+
+@lru_cache(maxsize=None)
+def _type_bit_array(mask: int):
+    """
+    NumPy uint8 view of the type-bit table for a charset mask, built once per
+    process on first vectorized use (callers have already imported NumPy).
+    """
+    import numpy as np
+    return np.frombuffer(PasswordGenerator._charset_for(mask).type_table, dtype=np.uint8)
+
+
+class _Charset(NamedTuple):
+    """Characters and lookup tables for one combination of character types."""
+    types: Tuple[str, ...]
+    chars: str
+    table: bytes
+    type_table: bytes
 
 
 class PasswordGenerator:
@@ -15,15 +89,28 @@ class PasswordGenerator:
     A secure password generator using cryptographically strong random generation.
     """
     
-    def __init__(self):
-        """Initialize the password generator."""
+    __slots__ = (
+        '_rng', 'lowercase', 'uppercase', 'digits', 'symbols',
+        'word_list', '_word_count', '_word_list_cap',
+    )
+    
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialize the password generator.
+        
+        Args:
+            rng: Optional random.Random-compatible source; by default
+                random bytes come straight from os.urandom
+        """
+        self._rng = rng
+        
         self.lowercase = string.ascii_lowercase
         self.uppercase = string.ascii_uppercase
         self.digits = string.digits
-        self.symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        self.symbols = _SYMBOLS_STR
         
         # Extended word list for passphrases
-        self.word_list = [
+        self.word_list = (
             "correct", "horse", "battery", "staple", "mountain", "river",
             "ocean", "forest", "castle", "dragon", "wizard", "knight",
             "phoenix", "thunder", "crystal", "shadow", "silver", "golden",
@@ -32,7 +119,9 @@ class PasswordGenerator:
             "kingdom", "lunar", "nebula", "orbit", "prism", "radar",
             "summit", "tempest", "ultraviolet", "vertex", "whisper", "xenon",
             "yellow", "zenith", "alpha", "bravo", "charlie", "delta"
-        ]
+        )
+        self._word_count = len(self.word_list)
+        self._word_list_cap = tuple(word.capitalize() for word in self.word_list)
     
     def generate(
         self,
@@ -58,43 +147,8 @@ class PasswordGenerator:
         Raises:
             ValueError: If length is too short or no character types selected
         """
-        if length < 8:
-            raise ValueError("Password length must be at least 8 characters")
-        
-        # Build character set
-        charset = ""
-        if use_lowercase:
-            charset += self.lowercase
-        if use_uppercase:
-            charset += self.uppercase
-        if use_digits:
-            charset += self.digits
-        if use_symbols:
-            charset += self.symbols
-        
-        if not charset:
-            raise ValueError("At least one character type must be selected")
-        
-        # Generate password ensuring at least one character from each selected type
-        password = []
-        
-        if use_lowercase:
-            password.append(secrets.choice(self.lowercase))
-        if use_uppercase:
-            password.append(secrets.choice(self.uppercase))
-        if use_digits:
-            password.append(secrets.choice(self.digits))
-        if use_symbols:
-            password.append(secrets.choice(self.symbols))
-        
-        # Fill remaining length with random characters from full charset
-        remaining_length = length - len(password)
-        password.extend(secrets.choice(charset) for _ in range(remaining_length))
-        
-        # Shuffle to avoid predictable patterns
-        secrets.SystemRandom().shuffle(password)
-        
-        return ''.join(password)
+        mask = self._charset_mask(length, use_lowercase, use_uppercase, use_digits, use_symbols)
+        return self._draw_password(length, mask)
     
     def generate_passphrase(
         self,
@@ -119,12 +173,11 @@ class PasswordGenerator:
         if word_count < 3:
             raise ValueError("Passphrase must contain at least 3 words")
         
-        selected_words = [secrets.choice(self.word_list) for _ in range(word_count)]
-        
-        if capitalize:
-            selected_words = [word.capitalize() for word in selected_words]
-        
-        return separator.join(selected_words)
+        words = self._word_list_cap if capitalize else self.word_list
+        indices = self._random_indices(word_count, self._word_count)
+        # A list comprehension beats a generator or map() here: str.join()
+        # materializes any non-list iterable into a list first
+        return separator.join([words[i] for i in indices])
     
     def generate_pin(self, length: int = 4) -> str:
         """
@@ -136,7 +189,17 @@ class PasswordGenerator:
         Returns:
             Generated PIN as string
         """
-        return ''.join(secrets.choice(self.digits) for _ in range(length))
+        if 0 < length <= _PIN_WORD_DIGITS:
+            # Draw the whole PIN as one 64-bit number below the largest multiple
+            # of 10**length, so a single random read usually suffices
+            limit = 10 ** length
+            cutoff = _PIN_WORD_LIMIT - _PIN_WORD_LIMIT % limit
+            while True:
+                value = int.from_bytes(self._random_bytes(8), 'big')
+                if value < cutoff:
+                    return f'{value % limit:0{length}d}'
+        
+        return self._random_indices(length, len(_DIGITS)).translate(_DIGITS_TABLE).decode('ascii')
     
     def generate_multiple(
         self,
@@ -150,9 +213,178 @@ class PasswordGenerator:
         Args:
             count: Number of passwords to generate
             length: Length of each password
-            **kwargs: Additional arguments passed to generate()
+            **kwargs: Character type options, as accepted by generate()
             
         Returns:
             List of generated passwords
+            
+        Raises:
+            ValueError: If length is too short or no character types selected
+        """
+        mask = self._charset_mask(length, **kwargs)
+        return self._generate_bulk(count, length, mask)
+    
+    def _charset_mask(
+        self,
+        length: int,
+        use_lowercase: bool = True,
+        use_uppercase: bool = True,
+        use_digits: bool = True,
+        use_symbols: bool = True
+    ) -> int:
+        """
+        Validate password options and return the index of their charset.
+        
+        Raises:
+            ValueError: If length is too short or no character types selected
+        """
+        if length < 8:
+            raise ValueError("Password length must be at least 8 characters")
+        
+        # Index of the charset for this combination of types
+        mask = (
+            bool(use_lowercase)
+            | bool(use_uppercase) << 1
+            | bool(use_digits) << 2
+            | bool(use_symbols) << 3
+        )
+        
+        if not mask:
+            raise ValueError("At least one character type must be selected")
+        
+        return mask
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _charset_for(mask: int) -> _Charset:
+        """
+        Build the charset for a mask of lowercase | uppercase << 1 | digits << 2
+        | symbols << 3, once per process.
+        
+        The bytes.translate() tables map an index in the charset to its ASCII
+        byte and to its type bit (1 << type number) respectively.
+        """
+        selected = [(bit, chars) for bit, chars in enumerate(_TYPES) if mask & (1 << bit)]
+        chars = b''.join(chars for _, chars in selected)
+        type_table = bytes(1 << bit for bit, chars in selected for _ in chars)
+        return _Charset(
+            types=tuple(chars.decode('ascii') for _, chars in selected),
+            chars=chars.decode('ascii'),
+            table=chars.ljust(256, b'\0'),
+            type_table=type_table.ljust(256, b'\0'),
+        )
+    
+    def _has_all_types(self, password: str, mask: int) -> bool:
+        """Check that password contains every character type selected by mask."""
+        return _contains_all(password, self._charset_for(mask).types)
+    
+    def _draw_password(self, length: int, mask: int) -> str:
+        """Draw one password from the charset selected by mask."""
+        return self._specialized_draw(mask, length)(self._random_bytes)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _specialized_draw(mask: int, length: int) -> Callable[[Callable[[int], bytes]], str]:
+        """
+        Build a password drawing function for one charset and length.
+        
+        The returned function takes a random_bytes(size) source and has the
+        reduction tables, charset table and type list bound as closure
+        variables, sharing _draw_reduced() and _contains_all() with the
+        generic path. It draws the whole password at once and redraws until
+        every selected type is present (rejection sampling keeps the result
+        uniform).
+        """
+        charset = PasswordGenerator._charset_for(mask)
+        reduction, rejected = _byte_reduction(len(charset.chars))
+        table = charset.table
+        types = charset.types
+        
+        if len(types) == 1:
+            # A single type is always present
+            def draw(random_bytes: Callable[[int], bytes]) -> str:
+                indices = _draw_reduced(random_bytes, length, reduction, rejected)
+                return indices.translate(table).decode('ascii')
+            return draw
+        
+        def draw(random_bytes: Callable[[int], bytes]) -> str:
+            while True:
+                indices = _draw_reduced(random_bytes, length, reduction, rejected)
+                password = indices.translate(table).decode('ascii')
+                if _contains_all(password, types):
+                    return password
+        return draw
+    
+    def _generate_bulk(self, count: int, length: int, mask: int) -> List[str]:
+        """
+        Draw count passwords with a single bulk random read.
+        
+        Indices for every password come from one _random_indices() call and
+        are mapped to characters with a single bytes.translate(); a password
+        missing a selected type is replaced by a fresh draw.
+        """
+        charset = self._charset_for(mask)
+        indices = self._random_indices(count * length, len(charset.chars))
+        chars = indices.translate(charset.table).decode('ascii')
+        
+        complete = None
+        if count >= _VECTORIZE_MIN_COUNT:
+            complete = self._rows_with_all_types(indices, count, length, mask)
+        
+        passwords = []
+        for row, start in enumerate(range(0, len(chars), length)):
+            password = chars[start:start + length]
+            if not (complete[row] if complete is not None else self._has_all_types(password, mask)):
+                password = self._draw_password(length, mask)
+            passwords.append(password)
+        
+        return passwords
+    
+    def _rows_with_all_types(
+        self,
+        indices: bytes,
+        count: int,
+        length: int,
+        mask: int
+    ) -> Optional[List[bool]]:
+        """
+        Check every password of a bulk draw for all selected types at once.
+        
+        The (count, length) index matrix is mapped to type bits and OR-reduced
+        per row with NumPy; a row is complete when its bits equal mask.
+        
+        Returns:
+            One flag per password, or None if NumPy is not installed
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        
+        type_bits = _type_bit_array(mask)
+        matrix = np.frombuffer(indices, dtype=np.uint8).reshape(count, length)
+        return (np.bitwise_or.reduce(type_bits[matrix], axis=1) == mask).tolist()
+    
+    def _random_bytes(self, size: int) -> bytes:
+        """Draw size random bytes in one call (os.urandom unless an rng was supplied)."""
+        if self._rng is None:
+            return os.urandom(size)
+        return self._rng.getrandbits(8 * size).to_bytes(size, 'little') if size else b''
+    
+    def _random_indices(self, n: int, modulus: int) -> bytes:
+        """
+        Draw n unbiased random integers in range(modulus).
+        
+        Random bytes are fetched in bulk and reduced modulo modulus; values
+        from the incomplete top range are rejected so every result is equally
+        likely. Both steps are a single bytes.translate() (see _draw_reduced()).
+        
+        Args:
+            n: Number of integers to draw
+            modulus: Exclusive upper bound (1 to 256)
+            
+        Returns:
+            The n integers as bytes
         """
-        return [self.generate(length=length, **kwargs) for _ in range(count)]
+        reduction, rejected = _byte_reduction(modulus)
+        return _draw_reduced(self._random_bytes, n, reduction, rejected)
@@ -10,15 +10,101 @@ from .generator import PasswordGenerator
 from .models import PasswordAnalysis
 
 
+_TOOL_NAME = "Password Security Tool"
+_TOOL_TITLE = _TOOL_NAME.upper()
+
+_MENU_HEADER = "\n".join([
+    "\n" + "=" * 60,
+    _TOOL_TITLE,
+    "=" * 60,
+    "1. Check Password Strength",
+    "2. Generate Secure Password",
+    "3. Generate Passphrase",
+    "4. Generate Multiple Passwords",
+    "5. Security Tips",
+    "6. Exit",
+    "=" * 60,
+])
+_MENU_PROMPT = "\nEnter your choice (1-6): "
+_EXIT_CHOICE = '6'
+
+_SECURITY_TIPS = """
+╔════════════════════════════════════════════════════════════╗
+║                    PASSWORD SECURITY TIPS                  ║
+╚════════════════════════════════════════════════════════════╝
+
+1. LENGTH MATTERS
+   • Use at least 12 characters (16+ recommended)
+   • Longer passwords are exponentially harder to crack
+
+2. USE VARIETY
+   • Mix uppercase, lowercase, numbers, and symbols
+   • Each character type increases password space
+
+3. AVOID PATTERNS
+   • Don't use dictionary words, names, or dates
+   • Avoid keyboard patterns (qwerty, 123456)
+   • No repeated characters (aaa, 111)
+
+4. UNIQUE PASSWORDS
+   • Never reuse passwords across accounts
+   • One breach shouldn't compromise all accounts
+
+5. USE A PASSWORD MANAGER
+   • Store passwords securely
+   • Generate strong unique passwords easily
+   • Access across all devices
+
+6. ENABLE 2FA
+   • Add second authentication factor
+   • Protects even if password is compromised
+
+7. REGULAR UPDATES
+   • Change passwords for sensitive accounts periodically
+   • Update immediately if breach suspected
+
+8. PASSPHRASES
+   • Consider memorable passphrases (4+ random words)
+   • Example: "correct-horse-battery-staple"
+   • Easier to remember, harder to crack
+
+9. AVOID PERSONAL INFO
+   • Don't use birthdays, names, or addresses
+   • Attackers can easily find this information
+
+10. BE WARY OF PHISHING
+    • Never enter passwords on suspicious websites
+    • Check URL before entering credentials
+
+╔════════════════════════════════════════════════════════════╗
+        """
+
+
 class PasswordSecurityTool:
     """
     Main class integrating password checking and generation functionality.
     """
     
-    def __init__(self):
-        """Initialize the password security tool."""
-        self.checker = PasswordStrengthChecker()
+    __slots__ = ('checker', 'generator', '_menu')
+    
+    def __init__(self, cache_analyses: bool = True):
+        """
+        Initialize the password security tool.
+        
+        Args:
+            cache_analyses: Memoize password analyses in the checker
+        """
+        self.checker = PasswordStrengthChecker(cache_analyses=cache_analyses)
         self.generator = PasswordGenerator()
+        
+        # Main menu choices, dispatched by display_menu()
+        self._menu = {
+            '1': self._do_check,
+            '2': self._do_generate,
+            '3': self._do_passphrase,
+            '4': self._do_multiple,
+            '5': self.display_security_tips,
+        }
     
     def analyze_password(self, password: str, display: bool = True) -> PasswordAnalysis:
         """
@@ -94,107 +180,52 @@ class PasswordSecurityTool:
     def display_menu(self) -> None:
         """Display main menu and handle user interaction."""
         while True:
-            print("\n" + "=" * 60)
-            print("PASSWORD SECURITY TOOL")
-            print("=" * 60)
-            print("1. Check Password Strength")
-            print("2. Generate Secure Password")
-            print("3. Generate Passphrase")
-            print("4. Generate Multiple Passwords")
-            print("5. Security Tips")
-            print("6. Exit")
-            print("=" * 60)
-            
-            choice = input("\nEnter your choice (1-6): ").strip()
-            
-            if choice == '1':
-                password = input("\nEnter password to check: ")
-                self.analyze_password(password)
+            print(_MENU_HEADER)
             
-            elif choice == '2':
-                self.generate_password_interactive()
+            choice = input(_MENU_PROMPT).strip()
             
-            elif choice == '3':
-                word_count = int(input("Number of words (3-6, default 4): ") or "4")
-                capitalize = input("Capitalize words? (y/N): ").lower() == 'y'
-                passphrase = self.generator.generate_passphrase(
-                    word_count=word_count,
-                    capitalize=capitalize
-                )
-                print(f"\nGenerated Passphrase: {passphrase}")
-                self.analyze_password(passphrase)
-            
-            elif choice == '4':
-                count = int(input("How many passwords? (default 5): ") or "5")
-                length = int(input("Password length? (default 16): ") or "16")
-                passwords = self.generator.generate_multiple(count=count, length=length)
-                print(f"\nGenerated {count} Passwords:")
-                for i, pwd in enumerate(passwords, 1):
-                    print(f"  {i}. {pwd}")
-            
-            elif choice == '5':
-                self.display_security_tips()
-            
-            elif choice == '6':
-                print("\nThank you for using Password Security Tool!")
+            if choice == _EXIT_CHOICE:
+                print(f"\nThank you for using {_TOOL_NAME}!")
                 break
             
-            else:
+            action = self._menu.get(choice)
+            if action is None:
                 print("\nInvalid choice. Please try again.")
+            else:
+                action()
+    
+    def _do_check(self) -> None:
+        """Menu action: analyze a password entered by the user."""
+        password = input("\nEnter password to check: ")
+        self.analyze_password(password)
+    
+    def _do_generate(self) -> None:
+        """Menu action: interactive password generation."""
+        self.generate_password_interactive()
+    
+    def _do_passphrase(self) -> None:
+        """Menu action: generate and analyze a passphrase."""
+        word_count = int(input("Number of words (3-6, default 4): ") or "4")
+        capitalize = input("Capitalize words? (y/N): ").lower() == 'y'
+        passphrase = self.generator.generate_passphrase(
+            word_count=word_count,
+            capitalize=capitalize
+        )
+        print(f"\nGenerated Passphrase: {passphrase}")
+        self.analyze_password(passphrase)
+    
+    def _do_multiple(self) -> None:
+        """Menu action: generate a batch of passwords."""
+        count = int(input("How many passwords? (default 5): ") or "5")
+        length = int(input("Password length? (default 16): ") or "16")
+        passwords = self.generator.generate_multiple(count=count, length=length)
+        print(f"\nGenerated {count} Passwords:")
+        for i, pwd in enumerate(passwords, 1):
+            print(f"  {i}. {pwd}")
     
     @staticmethod
     def display_security_tips() -> None:
         """Display password security best practices."""
-        tips = """
-╔════════════════════════════════════════════════════════════╗
-║                    PASSWORD SECURITY TIPS                  ║
-╚════════════════════════════════════════════════════════════╝
-
-1. LENGTH MATTERS
-   • Use at least 12 characters (16+ recommended)
-   • Longer passwords are exponentially harder to crack
-
-2. USE VARIETY
-   • Mix uppercase, lowercase, numbers, and symbols
-   • Each character type increases password space
-
-3. AVOID PATTERNS
-   • Don't use dictionary words, names, or dates
-   • Avoid keyboard patterns (qwerty, 123456)
-   • No repeated characters (aaa, 111)
-
-4. UNIQUE PASSWORDS
-   • Never reuse passwords across accounts
-   • One breach shouldn't compromise all accounts
-
-5. USE A PASSWORD MANAGER
-   • Store passwords securely
-   • Generate strong unique passwords easily
-   • Access across all devices
-
-6. ENABLE 2FA
-   • Add second authentication factor
-   • Protects even if password is compromised
-
-7. REGULAR UPDATES
-   • Change passwords for sensitive accounts periodically
-   • Update immediately if breach suspected
-
-8. PASSPHRASES
-   • Consider memorable passphrases (4+ random words)
-   • Example: "correct-horse-battery-staple"
-   • Easier to remember, harder to crack
-
-9. AVOID PERSONAL INFO
-   • Don't use birthdays, names, or addresses
-   • Attackers can easily find this information
-
-10. BE WARY OF PHISHING
-    • Never enter passwords on suspicious websites
-    • Check URL before entering credentials
-
-╔════════════════════════════════════════════════════════════╗
-        """
-        print(tips)
+        print(_SECURITY_TIPS)
 
 